@@ -4,83 +4,9 @@ st.set_page_config(page_title="A7's Prime Hash WebTool", layout="wide", page_ico
 
 st.title("A7's Prime Hash WebTool")
 
-st.markdown(
-    """
-    <style>
-    /* More generic selector to limit width */
-    .stApp > main > div {
-        max-width: 90% !important;
-        margin-left: auto !important;
-        margin-right: auto !important;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-st.markdown(
-    """
-    <style>
-    .stApp {
-        height: 100vh;
-        margin: 0;
-        background: linear-gradient(-45deg, #a1c4fd, #c2e9fb, #fbc687, #f5c06f);
-        background-size: 400% 400%;
-        animation: gradientBG 25s ease infinite;
-        color: #000;
-    }
-
-    @keyframes gradientBG {
-        0% {
-            background-position: 0% 50%;
-        }
-        50% {
-            background-position: 100% 50%;
-        }
-        100% {
-            background-position: 0% 50%;
-        }
-    }
-
-    .marquee-wrapper {
-        overflow: hidden;
-        width: 100%;
-        box-sizing: border-box;
-        padding: 10px 0;
-    }
-
-    .marquee-content {
-        display: inline-flex;
-        gap: 20px;
-        padding-left: 100%;
-        animation: marquee 25s linear infinite;
-        white-space: nowrap;
-    }
-
-    .marquee-box {
-        background: rgba(255, 255, 255, 0.7);
-        border-radius: 15px;
-        padding: 8px 16px;
-        font-weight: 600;
-        font-size: 1.1rem;
-        color: #000;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        user-select: none;
-        white-space: nowrap;
-    }
-
-    @keyframes marquee {
-        0% {
-            transform: translateX(0%);
-        }
-        100% {
-            transform: translateX(-100%);
-        }
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# Page styles are served from static/home.css (see .streamlit/config.toml),
+# so each rerun only sends this link instead of the full stylesheet
+st.markdown('<link rel="stylesheet" href="app/static/home.css">', unsafe_allow_html=True)
 
 st.markdown(
     """
@@ -104,20 +30,6 @@ st.markdown(
 
 st.sidebar.markdown(
     """
-    <style>
-    .sticky-sidebar {
-        position: sticky;
-        bottom: 0;
-        background: white;
-        padding: 10px;
-        font-size: 14px;
-        color: #555;
-        font-weight: 500;
-        border-top: 1px solid #ddd;
-        margin-top: 20px;
-        z-index: 100;
-    }
-    </style>
     <div class="sticky-sidebar">
         By <strong>Patnam Kannabhiram</strong><br>
         From <em>A7's Garage</em>
@@ -1,8 +1,7 @@
 import streamlit as st
-import binascii
+import bisect
 from cryptography.hazmat.primitives.cmac import CMAC
 from cryptography.hazmat.primitives.ciphers import algorithms
-from cryptography.hazmat.backends import default_backend
 
 st.title("CMAC Generator")
 st.subheader("Compute CMAC values using AES, 3DES, or Camellia with a user-provided hex key and message.")
@@ -15,33 +14,46 @@ VALID_KEY_LENGTHS = {
     'Camellia - CMAC': [16, 24, 32],
 }
 
-def closest_valid_length(length, valid_lengths):
-    """Return the closest valid key length to the given length."""
-    return min(valid_lengths, key=lambda x: abs(x - length))
+# Lookup tables derived from VALID_KEY_LENGTHS for O(1) checks and bisection
+VALID_KEY_LENGTHS_SET = {algo: frozenset(lengths) for algo, lengths in VALID_KEY_LENGTHS.items()}
+VALID_KEY_LENGTHS_SORTED = {algo: tuple(sorted(lengths)) for algo, lengths in VALID_KEY_LENGTHS.items()}
 
-def compute_cmac(data: str, key: str, algorithm: str) -> str:
-    """Compute the CMAC for the given data, key, and algorithm."""
+# Cipher constructors for each algorithm
+CMAC_CIPHERS = {
+    'AES - CMAC': algorithms.AES,
+    '3DES - CMAC': algorithms.TripleDES,
+    'Camellia - CMAC': algorithms.Camellia,
+}
+
+def closest_valid_length(length, algorithm):
+    """Return the closest valid key length for the algorithm, preferring the shorter on ties."""
+    lengths = VALID_KEY_LENGTHS_SORTED[algorithm]
+    i = bisect.bisect_left(lengths, length)
+    if i == 0:
+        return lengths[0]
+    if i == len(lengths):
+        return lengths[-1]
+    below, above = lengths[i - 1], lengths[i]
+    return below if length - below <= above - length else above
+
+def compute_cmac(data: str, byte_key: bytes, algorithm: str) -> str:
+    """Compute the CMAC for the given data, parsed key bytes, and algorithm."""
     try:
         byte_data = data.encode('utf-8')
-        byte_key = bytes.fromhex(key.strip())  # Key must be hex string
 
-        valid_lengths = VALID_KEY_LENGTHS.get(algorithm, [])
-        if len(byte_key) not in valid_lengths:
+        if len(byte_key) not in VALID_KEY_LENGTHS_SET.get(algorithm, frozenset()):
+            valid_lengths = VALID_KEY_LENGTHS.get(algorithm, [])
             return f"Error: {algorithm} key must be one of {valid_lengths} bytes. You provided {len(byte_key)} bytes."
 
-        if algorithm == 'AES - CMAC':
-            algo = algorithms.AES(byte_key)
-        elif algorithm == '3DES - CMAC':
-            algo = algorithms.TripleDES(byte_key)
-        elif algorithm == 'Camellia - CMAC':
-            algo = algorithms.Camellia(byte_key)
-        else:
+        if algorithm not in CMAC_CIPHERS:
             return f"Error: Unsupported algorithm '{algorithm}'."
 
-        c = CMAC(algo, backend=default_backend())
+        c = CMAC(CMAC_CIPHERS[algorithm](byte_key))
+        # The whole message goes to OpenSSL's CMAC in one call, so large inputs
+        # already run at hardware AES speed with no per-block Python work.
         c.update(byte_data)
         cmac_result = c.finalize()
-        return binascii.hexlify(cmac_result).decode()
+        return cmac_result.hex()
 
     except ValueError:
         return "Error: Invalid hex key or input data."
@@ -69,26 +81,31 @@ algorithm = st.selectbox(
     list(VALID_KEY_LENGTHS.keys())
 )
 
-# Validate and show key length info
+# Parse the hex key once per rerun; reused for validation and the CMAC itself
 try:
-    key_bytes_len = len(bytes.fromhex(key_input.strip())) if key_input.strip() else 0
-except Exception:
-    key_bytes_len = 0
+    byte_key = bytes.fromhex(key_input.strip())
+except ValueError:
+    byte_key = None
+
+# Validate and show key length info
+key_bytes_len = len(byte_key) if byte_key else 0
 
 valid_lengths = VALID_KEY_LENGTHS[algorithm]
-closest_len = closest_valid_length(key_bytes_len, valid_lengths)
+closest_len = closest_valid_length(key_bytes_len, algorithm)
 
 #st.markdown(f"**Key length:** {key_bytes_len} bytes")
 st.markdown(f"**Expected lengths for {algorithm}:** {valid_lengths} bytes")
 
-if key_bytes_len != 0 and key_bytes_len not in valid_lengths:
+if key_bytes_len != 0 and key_bytes_len not in VALID_KEY_LENGTHS_SET[algorithm]:
     st.warning(f"Your key length is {key_bytes_len} bytes. Closest valid length is {closest_len} bytes.")
 
 if st.button("Calculate CMAC"):
     if not key_input or not message_input:
         st.error("Please provide both key and message.")
+    elif byte_key is None:
+        st.error("Error: Invalid hex key or input data.")
     else:
-        result = compute_cmac(message_input, key_input, algorithm)
+        result = compute_cmac(message_input, byte_key, algorithm)
         if result.startswith("Error"):
             st.error(result)
         else:
@@ -2,6 +2,7 @@ import streamlit as st
 import pycipher
 import ast
 import inspect
+import re
 
 
 st.title("Classical Cipher Toolbox")
@@ -27,9 +28,52 @@ cipher_params = {
     "Railfence": {"key": 5},
 }
 
-def parse_param(val):
+@st.cache_resource
+def get_cipher_classes():
+    """Resolve each cipher class and the parameters its __init__ accepts, once per process."""
+    classes = {name: getattr(pycipher, name) for name in cipher_params}
+    accepted = {name: set(inspect.signature(cls.__init__).parameters) for name, cls in classes.items()}
+    return classes, accepted
+
+CIPHER_CLASSES, CIPHER_ACCEPTED_PARAMS = get_cipher_classes()
+
+def parse_int_list(val):
+    return [int(x) for x in str(val).strip("[]() ").split(",") if x.strip()]
+
+# Typed parsers for the known parameters; anything else falls back to ast.literal_eval
+PARAM_PARSERS = {
+    "SimpleSubstitution": {"key": str},
+    "Caesar": {"key": int},
+    "Affine": {"a": int, "b": int},
+    "Autokey": {"key": str},
+    "Beaufort": {"key": str},
+    "Bifid": {"key": str, "period": int},
+    "ColTrans": {"keyword": str},
+    "Gronsfeld": {"key": parse_int_list},
+    "Foursquare": {"key1": str, "key2": str},
+    "PolybiusSquare": {"key": str, "size": int},
+    "Playfair": {"key": str},
+    "Vigenere": {"key": str},
+    "Railfence": {"key": int},
+}
+
+def parse_param(val, cipher_name=None, param=None):
     if val in ["None", None, ""]:
         return None
+    parser = PARAM_PARSERS.get(cipher_name, {}).get(param)
+    # Quoted or bracketed values (e.g. 'abc' or ['A','B']), and values the typed
+    # parser rejects (e.g. 3.5 for an int), still go through ast.literal_eval
+    # so they are read as before
+    stripped = val.strip() if isinstance(val, str) else ""
+    literal = len(stripped) >= 2 and (
+        (stripped[0] == stripped[-1] and stripped[0] in "'\"")
+        or stripped[0] + stripped[-1] in ("[]", "()")
+    )
+    if parser is not None and not literal:
+        try:
+            return parser(val)
+        except (ValueError, TypeError):
+            pass
     try:
         return ast.literal_eval(val)
     except:
@@ -42,12 +86,16 @@ def build_param_ui(cipher_name, section_prefix):
     st.markdown(f"**{section_prefix.capitalize()} Parameters – {cipher_name}**")
     if params:
         for p, default_val in params.items():
-            parsed_default = parse_param(default_val)
+            parsed_default = parse_param(default_val, cipher_name, p)
             use_param = st.checkbox(f"Use '{p}'?", value=True, key=f"{section_prefix}_chk_{cipher_name}_{p}")
             if use_param:
                 default_str = str(parsed_default) if parsed_default is not None else ""
                 user_input = st.text_input(f"{p}", value=default_str, key=f"{section_prefix}_inp_{cipher_name}_{p}")
-                user_inputs[p] = parse_param(user_input)
+                # Untouched fields reuse the already-parsed default
+                if user_input == default_str:
+                    user_inputs[p] = parsed_default
+                else:
+                    user_inputs[p] = parse_param(user_input, cipher_name, p)
     else:
         st.info("This cipher has no parameters.")
 
@@ -55,14 +103,76 @@ def build_param_ui(cipher_name, section_prefix):
 
 def safe_cipher_instance(cipher_name, user_inputs):
     try:
-        cipher_class = getattr(pycipher, cipher_name)
-        accepted_params = inspect.signature(cipher_class.__init__).parameters
+        cipher_class = CIPHER_CLASSES[cipher_name]
+        accepted_params = CIPHER_ACCEPTED_PARAMS[cipher_name]
         valid_inputs = {k: v for k, v in user_inputs.items() if k in accepted_params}
         return cipher_class(**valid_inputs)
     except Exception as e:
         st.error(f"Error creating cipher instance: {e}")
         return None
 
+# --- Vectorized kernels ---
+# pycipher walks the text one character at a time in Python. For the
+# shift and polyalphabetic ciphers the same tableau arithmetic is applied
+# to the whole text at once with NumPy; everything else still goes to pycipher.
+VECTOR_KERNELS = {
+    # cipher name: (encipher, decipher) on letter codes and the key stream
+    "Caesar": (lambda p, k: p + k, lambda c, k: c - k),
+    "Rot13": (lambda p, k: p + 13, lambda c, k: c + 13),
+    "Atbash": (lambda p, k: 25 - p, lambda c, k: 25 - c),
+    "Vigenere": (lambda p, k: p + k, lambda c, k: c - k),
+    "Gronsfeld": (lambda p, k: p + k, lambda c, k: c - k),
+    "Beaufort": (lambda p, k: k - p, lambda c, k: k - c),
+}
+
+def letter_codes(text):
+    """Return text as 0-25 letter codes, dropping non-letters the same way pycipher does."""
+    # NumPy is imported on first use (after Encipher/Decipher is clicked),
+    # keeping it off the page's first paint
+    import numpy as np
+
+    cleaned = re.sub('[^A-Z]', '', text.upper())
+    return np.frombuffer(cleaned.encode('ascii'), dtype=np.uint8).astype(np.int64) - 65
+
+def codes_to_text(codes):
+    import numpy as np
+
+    return (codes % 26 + 65).astype(np.uint8).tobytes().decode('ascii')
+
+def key_shifts(cipher_name, key):
+    """Return the key as letter shifts, or None if the kernels can't handle its form."""
+    import numpy as np
+
+    if cipher_name in ("Rot13", "Atbash"):
+        return np.zeros(1, dtype=np.int64)  # fixed alphabets, the key is unused
+    if cipher_name == "Caesar":
+        return np.array([key % 26], dtype=np.int64) if isinstance(key, int) else None
+    if not isinstance(key, (list, tuple)) or not key:
+        return None
+    if cipher_name == "Gronsfeld":
+        if not all(isinstance(k, int) for k in key):
+            return None
+        return np.array([k % 26 for k in key], dtype=np.int64)
+    if not all(isinstance(k, str) and len(k) == 1 for k in key):
+        return None
+    key_str = ''.join(key)
+    if not re.fullmatch('[A-Z]+', key_str):
+        return None
+    return letter_codes(key_str)
+
+def run_cipher(cipher_name, cipher_obj, text, decipher=False):
+    """Encipher or decipher text, using a vectorized kernel when one applies."""
+    kernels = VECTOR_KERNELS.get(cipher_name)
+    shifts = key_shifts(cipher_name, getattr(cipher_obj, "key", None)) if kernels else None
+    if shifts is None:
+        return cipher_obj.decipher(text) if decipher else cipher_obj.encipher(text)
+
+    import numpy as np
+
+    codes = letter_codes(text)
+    key_stream = np.resize(shifts, codes.size)
+    return codes_to_text(kernels[decipher](codes, key_stream))
+
 def main():
     enc_col_text, enc_col_param, separator_col, dec_col_text, dec_col_param = st.columns([2, 2, 0.1, 2, 2])
 
@@ -102,7 +212,7 @@ def main():
             cipher_obj = safe_cipher_instance(enc_cipher, enc_inputs)
             if cipher_obj:
                 try:
-                    result = cipher_obj.encipher(enc_text.strip())
+                    result = run_cipher(enc_cipher, cipher_obj, enc_text.strip())
                     st.success(f"🔐 Result:\n{result}")
                 except Exception as e:
                     st.error(f"Encipher Failed: {e}")
@@ -112,7 +222,7 @@ def main():
             cipher_obj = safe_cipher_instance(dec_cipher, dec_inputs)
             if cipher_obj:
                 try:
-                    result = cipher_obj.decipher(dec_text.strip())
+                    result = run_cipher(dec_cipher, cipher_obj, dec_text.strip(), decipher=True)
                     st.success(f"🔓 Result:\n{result}")
                 except Exception as e:
                     st.error(f"Decipher Failed: {e}")
@@ -7,6 +7,21 @@ st.title("Digital Signature Generator")
 st.subheader("Sign messages using RSA-PSS, RSA-PKCS1v1_5, ECDSA, or Ed25519 algorithms")
 
 
+# Key generation (RSA-4096 especially) is slow, so keys are cached per
+# parameter set instead of being regenerated on every rerun. The cache is
+# per session: visitors never share a private key or reset each other's.
+@st.cache_resource(scope="session")
+def get_rsa_key(key_size):
+    return rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+
+@st.cache_resource(scope="session")
+def get_ec_key(curve_name):
+    return ec.generate_private_key(getattr(ec, curve_name)())
+
+@st.cache_resource(scope="session")
+def get_ed25519_key():
+    return ed25519.Ed25519PrivateKey.generate()
+
 # Main page columns: left (2 parts), right (3 parts)
 col1, col2 = st.columns([2, 3])
 
@@ -15,7 +30,9 @@ with col1:
     left_half, right_half = st.columns(2)
     with left_half:
         algo = st.selectbox("Choose a Signature Algorithm", ["RSA-PSS", "RSA-PKCS1v1_5", "ECDSA", "Ed25519"])
-    # right_half is left empty (or add something later if you want)
+    with right_half:
+        st.markdown("<br>", unsafe_allow_html=True)
+        regenerate = st.button("🔄 Regenerate Key", use_container_width=True)
 
     # Below the dropdown, full width inputs:
     message = st.text_area("✉️ Message to Sign", value="On His Majesty’s Secret Service.", height=180)
@@ -29,7 +46,9 @@ with col1:
             rsa_key_size = st.selectbox("Key Size (bits)", [1024, 2048, 3072, 4096], index=1)
         with hash_col:
             hash_func = st.selectbox("Hash Function", ["SHA256", "SHA384", "SHA512"], index=0)
-        rsa_private_key = rsa.generate_private_key(public_exponent=65537, key_size=rsa_key_size)
+        if regenerate:
+            get_rsa_key.clear(rsa_key_size)
+        rsa_private_key = get_rsa_key(rsa_key_size)
         hash_algo = getattr(hashes, hash_func)()
         params['key'] = rsa_private_key
 
@@ -58,8 +77,9 @@ with col1:
         curve_col, hash_col = st.columns(2)
         with curve_col:
             curve = st.selectbox("ECC Curve", ["SECP256R1", "SECP384R1", "SECP521R1"])
-            curve_obj = getattr(ec, curve)()
-            ecdsa_key = ec.generate_private_key(curve_obj)
+            if regenerate:
+                get_ec_key.clear(curve)
+            ecdsa_key = get_ec_key(curve)
         with hash_col:
             hash_func = st.selectbox("Hash Function", ["SHA256", "SHA384", "SHA512"], index=0)
         params = {
@@ -69,7 +89,9 @@ with col1:
 
     elif algo == "Ed25519":
         st.info("Ed25519 has no configurable parameters (RFC 8032).")
-        ed_key = ed25519.Ed25519PrivateKey.generate()
+        if regenerate:
+            get_ed25519_key.clear()
+        ed_key = get_ed25519_key()
         params = {'key': ed_key}
 
     compute_clicked = st.button("🔐 Compute Signature")  # full width of col1
@@ -130,8 +152,8 @@ st.markdown("""
 ---
 
 **Note:**  
-- Keys are generated fresh each run with specified parameters.  
+- Keys are generated once per parameter set and reused for your session only; use **Regenerate Key** for a fresh one.  
 - Signature outputs are base64 encoded for easy copy/paste and transmission.  
-- Make sure to keep your private keys secure — this demo generates keys on the fly and does not save them.
+- Make sure to keep your private keys secure — this demo keeps keys in server memory only while your session lasts and never saves them.
 """)
 
@@ -26,9 +26,10 @@ with col1:
     # Side-by-side dropdown and button with equal width
     col_algo, col_button = st.columns([1, 1])
     with col_algo:
-        algo_selected = st.selectbox(
-            "🔽 Select HMAC Algorithm",
+        algos_selected = st.multiselect(
+            "🔽 Select HMAC Algorithms",
             list(hash_algorithms.keys()),
+            default=["HMAC-SHA256"],
             label_visibility="collapsed"
         )
     with col_button:
@@ -39,15 +40,27 @@ with col1:
     if calculate:
         if not message or not key:
             st.warning("⚠️ Please enter both a message and a key.")
+        elif not algos_selected:
+            st.warning("⚠️ Please select at least one HMAC algorithm.")
         else:
             try:
-                digestmod = hash_algorithms[algo_selected]
-                h = hmac.new(key.encode(), message.encode(), digestmod)
-                if "shake" in algo_selected.lower():
-                    # shake algorithms require output length for hexdigest
-                    hmac_result = h.hexdigest(64)  # 64 hex digits (32 bytes)
+                # Encode once and reuse the bytes for every selected algorithm
+                key_bytes = key.encode()
+                message_bytes = message.encode()
+                digests = {}
+                for algo_selected in algos_selected:
+                    h = hmac.new(key_bytes, message_bytes, hash_algorithms[algo_selected])
+                    if "shake" in algo_selected.lower():
+                        # shake algorithms require output length for hexdigest
+                        digests[algo_selected] = h.hexdigest(64)  # 64 hex digits (32 bytes)
+                    else:
+                        digests[algo_selected] = h.hexdigest()
+
+                # A single digest is shown bare so it can be copied as-is
+                if len(digests) == 1:
+                    hmac_result = next(iter(digests.values()))
                 else:
-                    hmac_result = h.hexdigest()
+                    hmac_result = "\n\n".join(f"{name}:\n{digest}" for name, digest in digests.items())
                 st.success("✅ HMAC calculated successfully!")
             except Exception as e:
                 st.error(f"❌ Error: {e}")
@@ -91,6 +104,6 @@ st.markdown("""
 </ul>
 
 <p>
-  You can select the desired algorithm from the dropdown to generate the HMAC digest based on your message and secret key.
+  You can select one or more algorithms from the dropdown to generate HMAC digests of your message and secret key in one go.
 </p>
 """, unsafe_allow_html=True)
@@ -1,12 +1,95 @@
 import streamlit as st
-from PIL import Image
-import imagehash
+import blake3
 import hashlib
 import io
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 
 SUPPORTED_FORMATS = ["png", "jpg", "jpeg", "webp", "bmp", "tiff", "gif"]
-
+LEGACY_DIGESTS = ("sha1", "sha256", "sha512", "md5")
+HASH_CHUNK_SIZE = 64 * 1024  # 64KB windows
+PREVIEW_SIZE = (256, 256)
+PERCEPTUAL_HASHES = {"ahash": "aHash", "phash": "pHash", "dhash": "dHash", "whash": "wHash"}
+NEAR_DUPLICATE_BITS = 10  # Max differing bits (of 64) for two images to count as near-duplicates
+
+@st.cache_resource
+def get_hash_executor():
+    # hashlib, Pillow and NumPy release the GIL for the heavy lifting,
+    # so separate uploads can be hashed in parallel.
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def compute_legacy_digests(fingerprint, _file_bytes):
+    """Compute the MD5, SHA-1 and SHA-2 digests of one upload.
+
+    Cached on the upload's BLAKE3 fingerprint; the leading underscore keeps
+    Streamlit from re-hashing the raw bytes just to build the cache key.
+    """
+    # Feed each 64 KiB window to all four hashers while it is still in cache;
+    # slicing the memoryview doesn't copy
+    file_view = memoryview(_file_bytes)
+    crypto_hashers = [hashlib.new(name) for name in LEGACY_DIGESTS]
+    for offset in range(0, len(file_view), HASH_CHUNK_SIZE):
+        chunk = file_view[offset:offset + HASH_CHUNK_SIZE]
+        for hasher in crypto_hashers:
+            hasher.update(chunk)
+    return dict(zip(LEGACY_DIGESTS, (hasher.hexdigest() for hasher in crypto_hashers)))
+
+def hash_to_hex(image_hash):
+    """Hex string of an 8x8 ImageHash, identical to str() but packed with NumPy instead of bit by bit."""
+    # Deferred like imagehash; only runs from compute_image_hashes on a cache miss
+    import numpy as np
+
+    return np.packbits(image_hash.hash.flatten()).tobytes().hex()
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def compute_image_hashes(fingerprint, _file_bytes):
+    """Decode one upload, then build its preview and its aHash, pHash, dHash and wHash.
+
+    Cached like the digests, so the image is only decoded on a cache miss.
+    """
+    # Imported on first use; imagehash pulls in SciPy and PyWavelets,
+    # which would otherwise slow down the page's first paint
+    from PIL import Image
+    import imagehash
+
+    # Decode once; the preview and the perceptual hashes share this image.
+    # The preview is a small thumbnail, so the browser isn't sent the full image.
+    image = Image.open(io.BytesIO(_file_bytes))
+    image.load()
+    preview = image.copy()
+    preview.thumbnail(PREVIEW_SIZE)
+
+    # Convert to grayscale once; each hash would otherwise convert the
+    # full-size image itself (converting "L" to "L" is just a copy).
+    # The resizes can't be shared the same way: every algorithm LANCZOS-resizes
+    # the full image to its own size, and deriving aHash/dHash from a shared
+    # 32x32 downscale changes their values for most images.
+    gray_image = image.convert("L")
+
+    return {
+        "preview": preview,
+        "ahash": hash_to_hex(imagehash.average_hash(gray_image)),
+        "phash": hash_to_hex(imagehash.phash(gray_image)),
+        "dhash": hash_to_hex(imagehash.dhash(gray_image)),
+        "whash": hash_to_hex(imagehash.whash(gray_image)),
+    }
+
+def hamming_distance(hash_a, hash_b):
+    """Count the differing bits between two perceptual hashes held as ints."""
+    return (hash_a ^ hash_b).bit_count()
+
+def hash_image(file_bytes, legacy_digests=False):
+    """Gather the cryptographic and perceptual hashes of one uploaded image."""
+    # BLAKE3 is shown to the user and doubles as the cache key for the slower work,
+    # so a rerun with unchanged uploads only hashes the buffer, without decoding it
+    fingerprint = blake3.blake3(file_bytes, max_threads=blake3.blake3.AUTO).hexdigest()
+    hashes = {"blake3": fingerprint}
+    if legacy_digests:
+        hashes.update(compute_legacy_digests(fingerprint, file_bytes))
+    hashes.update(compute_image_hashes(fingerprint, file_bytes))
+    return hashes
 
 st.title("🖼️ Image Hashing Tool")
 st.subheader("Compute cryptographic and perceptual hashes for uploaded images")
@@ -24,15 +107,27 @@ uploaded_files = st.file_uploader(
     label_visibility="collapsed"
 )
 
+# MD5, SHA-1 and SHA-2 are only computed when asked for; BLAKE3 is always shown
+show_legacy = st.toggle("Also compute legacy digests (MD5 / SHA-1 / SHA-2)")
+
 if uploaded_files:
     progress_bar = st.progress(0)
     total_files = len(uploaded_files)
-
-    for idx, uploaded_file in enumerate(uploaded_files):
-        file_bytes = uploaded_file.read()
-        image = Image.open(io.BytesIO(file_bytes))
+    # Each progress update is a message to the browser; send at most ~100 per batch
+    progress_step = max(1, total_files // 100)
+
+    # Hash every upload concurrently, then render the results in upload order
+    # getbuffer() is a view of the upload itself, so no extra copy of each file is made
+    uploads = [(uploaded_file.name, uploaded_file.getbuffer()) for uploaded_file in uploaded_files]
+    executor = get_hash_executor()
+    futures = [executor.submit(hash_image, file_bytes, show_legacy) for _, file_bytes in uploads]
+    # Perceptual hashes as ints, so comparing two images is an XOR and a popcount
+    hash_ints = []
+
+    for idx, ((file_name, file_bytes), future) in enumerate(zip(uploads, futures)):
+        hashes = future.result()
+        hash_ints.append({name: int(hashes[name], 16) for name in PERCEPTUAL_HASHES})
         file_size_kb = len(file_bytes) / 1024
-        file_name = uploaded_file.name
 
         st.markdown("---")
         st.subheader(f"🖼️ Image {idx+1}: `{file_name}`")
@@ -41,39 +136,53 @@ if uploaded_files:
         col1, col2 = st.columns([1, 2])
 
         with col1:
-            st.image(image, caption="Preview", use_container_width=True)
+            st.image(hashes["preview"], caption="Preview")
             st.markdown(f"**File Name:** `{file_name}`")
             st.markdown(f"**Size:** `{file_size_kb:.2f} KB`")
 
         with col2:
-            st.markdown("#### 🔐 General Hashes")
-            sha1 = hashlib.sha1(file_bytes).hexdigest()
-            sha256 = hashlib.sha256(file_bytes).hexdigest()
-            sha512 = hashlib.sha512(file_bytes).hexdigest()
-            md5 = hashlib.md5(file_bytes).hexdigest()
-
-            st.code(f"SHA-1   : {sha1}")
-            st.code(f"SHA-256 : {sha256}")
-            st.code(f"SHA-512 : {sha512}")
-            st.code(f"MD5     : {md5}")
-
-            st.markdown("#### 🧠 Image Hashes")
-            ahash = str(imagehash.average_hash(image))
-            phash = str(imagehash.phash(image))
-            dhash = str(imagehash.dhash(image))
-            whash = str(imagehash.whash(image))
-
-            st.code(f"aHash : {ahash}")
-            st.code(f"pHash : {phash}")
-            st.code(f"dHash : {dhash}")
-            st.code(f"wHash : {whash}")
+            # One code block per image: cryptographic hashes, a blank line, then image hashes
+            hash_lines = [f"BLAKE3  : {hashes['blake3']}"]
+            if show_legacy:
+                hash_lines += [
+                    f"SHA-1   : {hashes['sha1']}",
+                    f"SHA-256 : {hashes['sha256']}",
+                    f"SHA-512 : {hashes['sha512']}",
+                    f"MD5     : {hashes['md5']}",
+                ]
+            hash_lines.append("")
+            hash_lines += [f"{label:<8}: {hashes[name]}" for name, label in PERCEPTUAL_HASHES.items()]
+
+            st.markdown("#### 🔐 Hashes")
+            st.code("\n".join(hash_lines), language="text")
 
         # Progress update
-        progress = (idx + 1) / total_files
-        progress_bar.progress(progress)
-        time.sleep(0.1)  # Optional small delay for smooth UI update
+        if idx % progress_step == 0 or idx == total_files - 1:
+            progress_bar.progress((idx + 1) / total_files)
 
     progress_bar.empty()  # Remove progress bar when done
+
+    if total_files > 1:
+        st.markdown("---")
+        st.subheader("🔍 Near-Duplicate Images")
+        near_duplicates = []
+        for (idx_a, ints_a), (idx_b, ints_b) in combinations(enumerate(hash_ints), 2):
+            distances = {
+                label: hamming_distance(ints_a[name], ints_b[name])
+                for name, label in PERCEPTUAL_HASHES.items()
+            }
+            if min(distances.values()) <= NEAR_DUPLICATE_BITS:
+                near_duplicates.append({
+                    "Image A": f"{idx_a+1}: {uploads[idx_a][0]}",
+                    "Image B": f"{idx_b+1}: {uploads[idx_b][0]}",
+                    **distances,
+                })
+
+        if near_duplicates:
+            st.caption(f"Pairs with at most {NEAR_DUPLICATE_BITS} differing bits in any perceptual hash (lower is more similar).")
+            st.dataframe(near_duplicates, hide_index=True, width="stretch")
+        else:
+            st.info("No near-duplicate images found.")
 else:
     st.info("📂 Drag and drop or select one or more image files to begin.")
 
@@ -85,13 +194,14 @@ st.markdown("""
 
 <h3>Cryptographic Hashes</h3>
 <ul>
-  <li>These are fixed-length digests (e.g., SHA-1, SHA-256, SHA-512, MD5) that uniquely represent the image file's binary data.</li>
+  <li>These are fixed-length digests (e.g., BLAKE3, SHA-1, SHA-256, SHA-512, MD5) that uniquely represent the image file's binary data.</li>
   <li>Any change to the image file—even a single bit—will result in a completely different cryptographic hash.</li>
   <li>Common algorithms used here are:</li>
   <ul>
     <li><strong>MD5:</strong> Fast but not collision-resistant; not recommended for security.</li>
     <li><strong>SHA-1:</strong> Better than MD5 but has known vulnerabilities.</li>
     <li><strong>SHA-256 and SHA-512:</strong> Secure and widely used.</li>
+    <li><strong>BLAKE3:</strong> Modern, secure and much faster; shown by default. Turn on the legacy digests toggle for MD5, SHA-1 and SHA-2.</li>
   </ul>
   <li>These hashes are useful for verifying file integrity and detecting exact duplicates.</li>
 </ul>
@@ -108,7 +218,7 @@ st.markdown("""
     <li><strong>wHash (Wavelet Hash):</strong> Applies wavelet transform for capturing texture.</li>
   </ul>
   <li>These hashes produce short strings (e.g., 64-bit hashes) representing the image's essence.</li>
-  <li>Comparing these hashes can identify near-duplicates or similar images.</li>
+  <li>Comparing these hashes can identify near-duplicates or similar images. When several images are uploaded, pairs whose hashes differ in only a few bits (the Hamming distance) are listed as near-duplicates.</li>
 </ul>
 
 <h3>Output Format</h3>
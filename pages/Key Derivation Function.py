@@ -1,12 +1,8 @@
 import streamlit as st
-from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Random import get_random_bytes
-from Crypto.Hash import HMAC, SHA1, SHA256, SHA512  # For PBKDF2 PRF
+from Crypto.Hash import SHA1, SHA256, SHA512  # For PBKDF2 PRF
 
-from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 st.title("🔐 Key Derivation Function (KDF)")
 st.markdown(
@@ -16,22 +12,27 @@ st.markdown(
     """
 )
 
+# KDF implementations are imported on first use to keep the page's first paint fast
 def derive_key_pbkdf2(password, salt, dkLen, count, hashmod):
-    return PBKDF2(password, salt, dkLen, count, lambda p, s: HMAC.new(p, s, hashmod).digest())
+    from Crypto.Protocol.KDF import PBKDF2
+    # hmac_hash_module keeps the whole iteration loop in PyCryptodome's C code;
+    # a Python prf callback would be called once per iteration
+    return PBKDF2(password, salt, dkLen, count, hmac_hash_module=hashmod)
 
 # --- scrypt Derivation ---
 def derive_key_scrypt(password, salt, key_len, N, r, p):
-    scrypt_kdf = Scrypt(salt=salt, length=key_len, n=N, r=r, p=p, backend=default_backend())
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    scrypt_kdf = Scrypt(salt=salt, length=key_len, n=N, r=r, p=p)
     return scrypt_kdf.derive(password)
 
 # --- HKDF Derivation ---
 def derive_key_hkdf(input_key_material, salt, info, length, hash_algorithm):
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
     hkdf = HKDF(
         algorithm=hash_algorithm,
         length=length,
         salt=salt,
-        info=info,
-        backend=default_backend()
+        info=info
     )
     return hkdf.derive(input_key_material)
 
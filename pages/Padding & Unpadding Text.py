@@ -7,45 +7,59 @@ st.subheader("Apply and remove various padding schemes on UTF-8 text")
 
 
 # --- Padding functions ---
+def check_pad_len(data: bytes) -> int:
+    """Return the pad length stored in the last byte, shared by the length-byte schemes."""
+    pad_len = data[-1]
+    if pad_len < 1 or pad_len > len(data):
+        raise ValueError("Invalid padding length")
+    return pad_len
+
 def pkcs7_pad(data: bytes, block_size: int) -> bytes:
     pad_len = block_size - (len(data) % block_size)
-    return data + bytes([pad_len] * pad_len)
+    return data + bytes([pad_len]) * pad_len
 
 def pkcs7_unpad(data: bytes) -> bytes:
-    pad_len = data[-1]
-    if pad_len < 1 or pad_len > len(data):
-        raise ValueError("Invalid padding length")
-    if data[-pad_len:] != bytes([pad_len] * pad_len):
+    pad_len = check_pad_len(data)
+    # Compare the whole tail as one integer (pad_len repeated pad_len times) so
+    # the check doesn't stop at the first wrong byte or build a reference copy
+    expected = pad_len * (((1 << (8 * pad_len)) - 1) // 0xFF)
+    if int.from_bytes(data[-pad_len:], "big") ^ expected:
         raise ValueError("Invalid PKCS7 padding bytes")
     return data[:-pad_len]
 
 def zero_pad(data: bytes, block_size: int) -> bytes:
     pad_len = block_size - (len(data) % block_size)
-    return data + bytes([0] * pad_len)
+    return data + bytes(pad_len)
 
 def zero_unpad(data: bytes) -> bytes:
     return data.rstrip(b'\x00')
 
 def ansi_x923_pad(data: bytes, block_size: int) -> bytes:
     pad_len = block_size - (len(data) % block_size)
-    return data + bytes([0] * (pad_len - 1)) + bytes([pad_len])
+    # bytearray() starts zero-filled, so only the data and length byte are written
+    out = bytearray(len(data) + pad_len)
+    out[:len(data)] = data
+    out[-1] = pad_len
+    return bytes(out)
 
 def ansi_x923_unpad(data: bytes) -> bytes:
-    pad_len = data[-1]
-    if pad_len < 1 or pad_len > len(data):
-        raise ValueError("Invalid padding length")
-    if data[-pad_len:-1] != bytes([0] * (pad_len - 1)):
+    pad_len = check_pad_len(data)
+    # Every byte before the length byte must be zero; checked in one pass like PKCS7
+    if int.from_bytes(data[-pad_len:-1], "big"):
         raise ValueError("Invalid ANSI X.923 padding")
     return data[:-pad_len]
 
 def iso_10126_pad(data: bytes, block_size: int) -> bytes:
     pad_len = block_size - (len(data) % block_size)
-    return data + os.urandom(pad_len - 1) + bytes([pad_len])
+    # Build the result in one buffer: data, random filler, then the length byte
+    out = bytearray(len(data) + pad_len)
+    out[:len(data)] = data
+    out[len(data):-1] = os.urandom(pad_len - 1)
+    out[-1] = pad_len
+    return bytes(out)
 
 def iso_10126_unpad(data: bytes) -> bytes:
-    pad_len = data[-1]
-    if pad_len < 1 or pad_len > len(data):
-        raise ValueError("Invalid padding length")
+    pad_len = check_pad_len(data)
     return data[:-pad_len]
 
 # --- Padding registry ---
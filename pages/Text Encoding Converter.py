@@ -8,7 +8,13 @@ st.title("Text Encoding Converter")
 st.subheader("Encode your text into various Encodings.")
 
 
+# Codecs that transform bytes to bytes rather than text to bytes
+CODEC_SUFFIX = '_codec'
+SPECIAL_CODECS = frozenset({'base64', 'hex', 'bz2', 'quopri', 'uu', 'zlib'})
+
+
 # --- Utils ---
+@st.cache_data
 def get_all_encodings():
     """Get a list of all available text encodings in Python."""
     encodings_list = set()
@@ -19,12 +25,14 @@ def get_all_encodings():
 def encode_text(text, encoding):
     """Encode text using the selected encoding. Handles both standard and codec-based encodings."""
     try:
-        if encoding.endswith('_codec') or encoding in {'base64', 'hex', 'bz2', 'quopri', 'uu', 'zlib'}:
+        if encoding.endswith(CODEC_SUFFIX) or encoding in SPECIAL_CODECS:
             byte_input = text.encode('utf-8')
             encoded_bytes = codecs.encode(byte_input, encoding)
             return encoded_bytes.decode('utf-8', errors='replace')
         else:
-            return text.encode(encoding).decode(encoding)
+            # Show the bytes the encoding produced, always as hex so the output is
+            # unambiguous (decoding them back would just echo the input)
+            return text.encode(encoding).hex()
     except Exception as e:
         return f"[Encoding Error]: {e}"
 
@@ -76,6 +84,8 @@ st.markdown("""
 <li><b>bz2, zlib:</b> Compression codecs that encode data into compressed formats.</li>
 </ul>
 
+<p><b>Output:</b> Text encodings show the encoded bytes as a hex string (e.g. "é" in UTF-8 is <code>c3a9</code>).</p>
+
 <p><b>Note:</b> Always choose the right encoding for your use case to avoid data corruption or loss. This tool helps you convert text between many encodings to test compatibility and correctness.</p>
 """, unsafe_allow_html=True)
 
@@ -4,6 +4,8 @@ import hashlib
 st.title("Text Hash Generator")
 st.subheader("Encode your input text and compute its hash using various algorithms and encodings")
 
+HASH_CHUNK_SIZE = 64 * 1024  # 64KB windows
+
 col1, col2 = st.columns(2)
 
 with col1:
@@ -36,8 +38,12 @@ if compute:
     else:
         try:
             encoded_text = input_text.encode(selected_encoding)
-            h = hashlib.new(selected_hash)
-            h.update(encoded_text)
+            # The named constructor (e.g. hashlib.sha256) skips hashlib.new's name lookup
+            h = getattr(hashlib, selected_hash)()
+            # Feed long inputs in 64KB memoryview windows (zero-copy) rather than one blob
+            text_view = memoryview(encoded_text)
+            for offset in range(0, len(text_view), HASH_CHUNK_SIZE):
+                h.update(text_view[offset:offset + HASH_CHUNK_SIZE])
 
             if selected_hash.startswith("shake_"):
                 output_hash = h.hexdigest(64)